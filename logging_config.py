@@ -16,7 +16,12 @@ def setup_logging():
     - Logs of level INFO and higher to 'general.log'.
     - Logs of level ERROR and higher to 'errors.log'.
     - Logs of level WARNING and higher to the console, excluding ERROR logs.
+
+    Calling it again is a no-op, so handlers are never attached twice.
     """
+    if logging.getLogger('general_logger').handlers:
+        return
+
     # Create formatters
     detailed_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(funcName)s - %(message)s')
     simple_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
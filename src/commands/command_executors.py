@@ -6,6 +6,7 @@ This module defines classes for executing various types of commands within the T
 Classes:
     ActionExecutor:
         Executes predefined actions or operations, typically by evaluating a string of Python code.
+        Simple actions are turned into plain function calls once and never reach exec.
         Optionally updates the application state after execution.
 
     InteractiveCommandExecutor:
@@ -17,6 +18,9 @@ Usage:
     Use ActionExecutor for direct action execution, and InteractiveCommandExecutor for commands
     that require user interaction or dynamic responses.
 """
+import ast
+import functools
+
 from src.utils.logging_utils import info_logger, warning_logger, error_logger
 from src.constants.command_constants import ProgrammingLanguage, TerminalOS
 from src.utils.gui_utils import press, write, scroll
@@ -24,6 +28,119 @@ from src.utils.text_to_speech import text_to_speech
 from src.utils.date_time_utils import (get_current_time, get_current_date, month_number_to_name, day_number_to_name,
                                        get_day_of_week)
 
+# Spoken prefixes answered by InteractiveCommandExecutor
+_TIME_QUERIES = ("what time is it", "what's the time")
+_DATE_QUERY = "what's the date"
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_action(action: str):
+    """
+    Compiles an action string once; the command set is small and fixed, so every later call is a cache hit.
+
+    Args:
+        action (str): The Python code of the action.
+
+    Returns:
+        code: The compiled code object.
+    """
+    return compile(action, "<action>", "exec")
+
+
+# Names an action can call or reference without going through exec. The input functions are looked up
+# in this module when the action runs, so patching them here affects every action.
+_ACTION_FUNCTIONS = frozenset(("press", "write", "scroll"))
+_ACTION_CONSTANTS = {"ProgrammingLanguage": ProgrammingLanguage, "TerminalOS": TerminalOS}
+
+
+# Restricted set of built-ins and allowed names for actions run through exec; ActionExecutor adds the input
+# functions and app_state on each run
+_SAFE_GLOBALS_BASE = {
+    "__builtins__": {},  # No built-ins by default!
+    "setattr": setattr,
+    "ProgrammingLanguage": ProgrammingLanguage,
+    "TerminalOS": TerminalOS,
+}
+
+
+def _action_argument(node: ast.expr):
+    """
+    Evaluates an action argument that is a literal or a ProgrammingLanguage/TerminalOS member.
+
+    Raises:
+        ValueError: If the argument is anything else.
+    """
+    if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+            and node.value.id in _ACTION_CONSTANTS):
+        try:
+            return getattr(_ACTION_CONSTANTS[node.value.id], node.attr)
+        except AttributeError as e:
+            raise ValueError(node.attr) from e
+    return ast.literal_eval(node)
+
+
+def _build_action_step(node: ast.expr):
+    """
+    Builds a callable taking app_state for a single call in an action.
+
+    Supported calls are press/write/scroll, setattr on app_state and app_state methods, all with
+    arguments that _action_argument can evaluate.
+
+    Returns:
+        Callable | None: The step, or None if the call has any other shape.
+    """
+    if not isinstance(node, ast.Call) or any(keyword.arg is None for keyword in node.keywords):
+        return None
+    func = node.func
+    arg_nodes = node.args
+    kwargs = {keyword.arg: _action_argument(keyword.value) for keyword in node.keywords}
+
+    if isinstance(func, ast.Name) and func.id in _ACTION_FUNCTIONS:
+        function_name = func.id
+        args = tuple(_action_argument(arg) for arg in arg_nodes)
+        return lambda app_state: globals()[function_name](*args, **kwargs)
+
+    if (isinstance(func, ast.Name) and func.id == "setattr" and not kwargs and len(arg_nodes) == 3
+            and isinstance(arg_nodes[0], ast.Name) and arg_nodes[0].id == "app_state"):
+        attribute, value = _action_argument(arg_nodes[1]), _action_argument(arg_nodes[2])
+        return lambda app_state: setattr(app_state, attribute, value)
+
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "app_state":
+        method_name = func.attr
+        args = tuple(_action_argument(arg) for arg in arg_nodes)
+        return lambda app_state: getattr(app_state, method_name)(*args, **kwargs)
+
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _build_action_thunk(action: str):
+    """
+    Turns an action made of supported calls (see _build_action_step), alone or in a tuple, into a callable.
+
+    Args:
+        action (str): The Python code of the action.
+
+    Returns:
+        Callable | None: A function taking app_state that performs the action, or None when the action
+        has to go through exec.
+    """
+    try:
+        body = ast.parse(action.strip(), mode="eval").body
+        nodes = body.elts if isinstance(body, ast.Tuple) else [body]
+        steps = [_build_action_step(node) for node in nodes]
+    except (SyntaxError, ValueError, TypeError):
+        return None
+    if not steps or None in steps:
+        return None
+    if len(steps) == 1:
+        return steps[0]
+
+    def run_steps(app_state):
+        for step in steps:
+            step(app_state)
+    return run_steps
+
 
 class ActionExecutor:
     """
@@ -33,6 +150,8 @@ class ActionExecutor:
         execute(action: str, app_state: Optional[AppState] = None) -> None
             Executes the given action string. Optionally updates the application state.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -48,19 +167,15 @@ class ActionExecutor:
         Raises:
             Exception: Logs and raises any exception that occurs during execution.
         """
-         # Define a restricted set of built-ins and allowed functions
-        safe_globals = {
-            "__builtins__": {},  # No built-ins by default!
-            "app_state": app_state,
-            "press": press,
-            "write": write,
-            "scroll": scroll,
-            "setattr": setattr,
-            "ProgrammingLanguage": ProgrammingLanguage,
-            "TerminalOS": TerminalOS,
-        }
         try:
-            exec(action, safe_globals)
+            thunk = _build_action_thunk(action)
+            if thunk is not None:
+                thunk(app_state)
+            else:
+                # Actions may assign names, so each run gets its own copy of the restricted globals
+                safe_globals = _SAFE_GLOBALS_BASE.copy()
+                safe_globals.update(press=press, write=write, scroll=scroll, app_state=app_state)
+                exec(_compile_action(action), safe_globals)
             if app_state:
                 app_state.update_status()
             info_logger.info(f"Executed action: {action}")
@@ -77,6 +192,7 @@ class InteractiveCommandExecutor:
     Args:
         name (str): The name of the interactive command to execute.
     """
+    __slots__ = ("name",)
 
     def __init__(self, name: str):
         self.name = name
@@ -85,21 +201,26 @@ class InteractiveCommandExecutor:
         """
         Executes the interactive command based on its name.
         """
-        if self.name.startswith(("what time is it", "what's the time")):
+        if self.name.startswith(_TIME_QUERIES):
             current_time = get_current_time()
             text_to_speech(f"it's {current_time}")
             info_logger.info(f"Spoken time: {current_time}")
+        else:
+            # Time queries are by far the most common; everything else goes through the slower path
+            self._execute_other()
 
-        elif self.name.startswith("what's the date"):
+    def _execute_other(self) -> None:
+        """
+        Answers date queries and reports unrecognized interactive commands.
+        """
+        if self.name.startswith(_DATE_QUERY):
             current_date_time = get_current_date()
-            month, day = current_date_time.strftime("%m-%d").split("-")
-            month_name = month_number_to_name(int(month))
-            day_name = day_number_to_name(int(day))
-            week_day = get_day_of_week(current_date_time.strftime("%Y-%m-%d"))
+            month_name = month_number_to_name(current_date_time.month)
+            day_name = day_number_to_name(current_date_time.day)
+            week_day = get_day_of_week(current_date_time)
             current_date = f"{week_day}, {month_name} {day_name}"
             text_to_speech(current_date)
             info_logger.info(f"Spoken date: {current_date}")
-
         else:
             text_to_speech("no input")
             warning_logger.warning(f"Unrecognized interactive command: {self.name}")
@@ -38,6 +38,8 @@ Usage:
     command.execute(app_state)
     command_dict = command.commands_to_dict(include_num_key=False)
 """
+import sys
+
 from src.commands.command_executors import ActionExecutor, InteractiveCommandExecutor
 from src.constants.command_constants import CommandType
 
@@ -57,14 +59,17 @@ class CommandManager:
             key (str, optional): The key to be pressed for keyboard or programming commands.
             num_key (str, optional): The key used for commands that can be repeated multiple times.
         """
-        self.name = name
+        # Names loaded from JSON are fresh strings; interning lets equality checks short-circuit on identity
+        self.name = sys.intern(name)
         self.command_type = command_type
         self.key = key
         self.num_key = num_key
         self.action = action
 
-        self.action_executor = ActionExecutor()
-        self.interactive_command_executor = InteractiveCommandExecutor(self.name)
+        # ActionExecutor is stateless, so only interactive commands need an executor object of their own
+        self.interactive_command_executor = (
+            InteractiveCommandExecutor(self.name) if command_type is CommandType.INTERACTIVE else None
+        )
 
     def commands_to_dict(self, include_num_key: bool=True) -> dict:
         """
@@ -85,24 +90,31 @@ class CommandManager:
             command_dict["num_key"] = self.num_key
         return command_dict
 
-    def execute(self, app_state) -> None:
-        """
-    Executes the command according to its type using the current application state.
+    def _execute_switch(self, app_state) -> None:
+        """Runs a switch action, which updates the application state."""
+        ActionExecutor.execute(self.action, app_state)
 
-    Args:
-        app_state (AppState): The current application state.
+    def _execute_interactive(self, app_state) -> None:
+        """Runs an interactive command, which answers the user instead of acting on the application."""
+        self.interactive_command_executor.execute()
 
-    Depending on the command type, delegates execution to the appropriate executor (action, terminal, or interactive).
-    """
-        if self.command_type == CommandType.SWITCH:
-            print("in command manager.execute IF", self.command_type, self.action)
-            self.action_executor.execute(self.action, app_state)
+    def _execute_action(self, app_state) -> None:
+        """Runs a plain action that does not touch the application state."""
+        ActionExecutor.execute(self.action)
 
-        elif self.command_type == CommandType.INTERACTIVE:
-            print("in command manager.execute ELIF2", self.command_type, self.action)
-            self.interactive_command_executor.execute()
+    # Command types that need special handling; every other type runs its action directly
+    _DISPATCH = {
+        CommandType.SWITCH: _execute_switch,
+        CommandType.INTERACTIVE: _execute_interactive,
+    }
 
-        else:
-            print("in command manager.execute ELSE", self.command_type, self.action)
-            self.action_executor.execute(self.action)
+    def execute(self, app_state) -> None:
+        """
+        Executes the command according to its type using the current application state.
+
+        Args:
+            app_state (AppState): The current application state.
 
+        Depending on the command type, delegates execution to the appropriate executor (action, terminal, or interactive).
+        """
+        self._DISPATCH.get(self.command_type, CommandManager._execute_action)(self, app_state)
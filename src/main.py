@@ -14,11 +14,13 @@ Raises:
 import json
 import threading  # noqa: F401
 
+from logging_config import setup_logging
 from src.utils.logging_utils import info_logger, error_logger
 from src.constants.main_constants import command_files_directory
 from src.state.app_state import AppState
 from src.ui.texter_ui import TexterUI
 from src.utils.command_utils import get_commands
+from src.utils.gui_utils import start_input_queue
 from src.utils.live_speech_interpreter import run_live_speech_interpreter
 
 
@@ -60,6 +62,8 @@ def main():
     """
     Initializes and runs the application.
     """
+    setup_logging()
+    start_input_queue()
     try:
         app, app_state, commands = initialize_application()
         info_logger.info("Starting UI...")
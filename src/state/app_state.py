@@ -46,6 +46,7 @@ from typing import List
 from src.commands.command_manager import CommandManager
 from src.constants.command_constants import CommandType, ProgrammingLanguage, TerminalOS
 from src.constants.app_state_constants import command_groups, Mode
+from src.utils.gui_utils import flush_input
 
 
 class AppState:
@@ -65,6 +66,20 @@ class AppState:
         app_ui: Optional UI object for updating application status.
     """
 
+    # Command group attributes in the order handle_command tries them
+    _COMMAND_GROUPS = (
+        "switch_commands",
+        "keyboard_commands",
+        "info_commands",
+        "selection_commands",
+        "programming_commands",
+        "terminal_commands",
+        "spelling_commands",
+        "git_commands",
+        "interactive_commands",
+        "browser_commands",
+    )
+
     def __init__(self, app_ui=None):
         self.mode = Mode.DICTATION
         self.typing_active = True
@@ -90,6 +105,10 @@ class AppState:
         self.interactive_commands = []
         self.browser_commands = []
 
+        # handle_command lookup table, rebuilt whenever a command group list is replaced or resized
+        self._command_index = {}
+        self._command_index_groups = ()
+
         # Additional settings
         self.spelling = False
         self.punctuation = False
@@ -157,18 +176,31 @@ class AppState:
         Returns:
             A list of all CommandManager objects.
         """
-        return (
-                self.switch_commands +
-                self.keyboard_commands +
-                self.info_commands +
-                self.selection_commands +
-                self.programming_commands +
-                self.terminal_commands +
-                self.spelling_commands +
-                self.git_commands +
-                self.interactive_commands +
-                self.browser_commands
-        )
+        return [command for group in self._COMMAND_GROUPS for command in getattr(self, group)]
+
+    def _get_command_index(self) -> dict:
+        """
+        Returns the loaded commands bucketed by the first character of their name.
+
+        A command can only be a prefix of the text when their first characters match, so handle_command
+        only has to scan one bucket. Each bucket keeps the order of get_all_commands, so the first match wins
+        exactly as it would in a full scan.
+
+        Returns:
+            dict: A mapping of first character to the commands whose name starts with it.
+        """
+        groups = tuple(getattr(self, group) for group in self._COMMAND_GROUPS)
+        cached_groups = self._command_index_groups
+        if len(groups) != len(cached_groups) or any(
+                group is not cached_group or len(group) != size
+                for group, (cached_group, size) in zip(groups, cached_groups)):
+            index = {}
+            for group in groups:
+                for command in group:
+                    index.setdefault(command.name[:1], []).append(command)
+            self._command_index = index
+            self._command_index_groups = tuple((group, len(group)) for group in groups)
+        return self._command_index
 
     def handle_command(self, text: str) -> bool:
         """
@@ -180,9 +212,7 @@ class AppState:
         Returns:
         - bool: True if a command was successfully handled, False otherwise.
         """
-        all_commands = self.get_all_commands()
-
-        for command in all_commands:
+        for command in self._get_command_index().get(text[:1], ()):
             if text.startswith(command.name):
                 try:
                     if hasattr(command, 'command_executor'):
@@ -237,16 +267,22 @@ class AppState:
         self.update_status()
 
     def switch_punctuation(self) -> None:
-        """Toggle punctuation On/OFF."""
-        self.switch_attribute("punctuation")
-        self.punctuation = self.capitalize or self.punctuation
-        self.update_status()
+        """
+        Toggle punctuation On/OFF. Turning punctuation off also turns capitalization off.
+
+        The status is refreshed by the switch command that triggers this method.
+        """
+        punctuation = not self.punctuation
+        self.punctuation, self.capitalize = punctuation, punctuation and self.capitalize
 
     def switch_capitalization(self) -> None:
-        """Toggle capitalization On/OFF."""
-        self.switch_attribute("capitalize")
-        self.capitalize = self.punctuation or self.capitalize
-        self.update_status()
+        """
+        Toggle capitalization On/OFF. Turning capitalization on also turns punctuation on.
+
+        The status is refreshed by the switch command that triggers this method.
+        """
+        capitalize = not self.capitalize
+        self.punctuation, self.capitalize = capitalize or self.punctuation, capitalize
 
     def switch_attribute(self, attribute):
         """Toggle the boolean value of a given attribute."""
@@ -270,5 +306,7 @@ class AppState:
     @staticmethod
     def restart_script() -> None:
         """Restart the currently running script."""
+        # The input queue is a daemon thread, so anything still queued would be lost on exit
+        flush_input(raise_errors=False)
         subprocess.Popen([sys.executable] + sys.argv)
         sys.exit()
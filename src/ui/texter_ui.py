@@ -30,7 +30,7 @@ Initializes the `TexterUI` instance, setting up attributes and initializing the
 
 - `load_image(filename)`:
 
-Loads and resizes an image for use in buttons (e.g., wake up, terminate).
+Loads an image for use in buttons (e.g., wake up, terminate).
 
 
 
@@ -72,13 +72,14 @@ Create a section for displaying commands and controlling the display of active c
 
 - `reload_commands(self)`:
 
-Reloads commands from an updated file and refreshes the command display.
+Re-reads the command files on a worker thread, then loads them into the app state and refreshes
+the command display on the Tk thread when they changed.
 
 
 
 - `toggle_status_textbox(self)`:
 
-Toggles the visibility of the commands section, expanding or collapsing it.
+Toggles the visibility of the commands section, expanding or collapsing it and rendering updates deferred while collapsed.
 
 
 
@@ -94,6 +95,12 @@ Safely terminates all threads and exits the application.
 
 
 
+- `_join_speech_thread(self)`:
+
+Waits for the speech thread to finish unless it is the calling thread.
+
+
+
 - `on_wake_up_button_click(self)`:
 
 Activates the typing mode and updates the UI status.
@@ -112,15 +119,33 @@ Retrieve all active commands grouped by type (e.g., info commands, git commands)
 
 
 
-- `format_command_block(command_type, commands)`:
+- `format_command_block(cls, command_type, commands)`:
 
 Formats commands into a string block for display.
 
 
 
+- `get_commands_signature(self)`:
+
+Returns a cheap signature of the displayed command set, used to skip redundant redraws.
+
+
+
 - `print_all_commands(self)`:
 
-Displays all active commands in the UI.
+Displays all active commands in the UI, redrawing only when the command set has changed.
+
+
+
+- `_render_all_command_blocks(self, commands)`:
+
+Redraws every command block and marks where each block starts.
+
+
+
+- `_render_changed_command_blocks(self, commands)`:
+
+Rewrites only the command blocks whose commands changed since the last render.
 
 
 
@@ -132,7 +157,7 @@ Updates the UI to reflect the current status of the app.
 
 - `append_text(self, text)`:
 
-Appends text to the input text box and scrolls to the end.
+Appends text to the input text box, trims the oldest lines beyond the scrollback limit and scrolls to the end.
 
 
 
@@ -148,6 +173,12 @@ Updates the commands display in a thread-safe manner.
 
 
 
+- `_flush_status(self)`:
+
+Renders the most recent status message queued by `update_status`.
+
+
+
 - `_update_status_ui(self, status_message)`:
 
 Updates the status text box with the latest status message.
@@ -164,8 +195,6 @@ Dependencies:
 
 - `tkinter`: The standard Python library for creating GUIs.
 
-- `json`: Used for processing commands as JSON objects.
-
 - `os`, `sys`: Libraries for working with file paths and system functionalities.
 
 
@@ -180,18 +209,14 @@ texter_ui.init_ui(app_state, commands_dict)
 from __future__ import annotations
 
 import threading
-import json
 import os
 import sys
 import tkinter as tk
 from tkinter import scrolledtext, ttk
-import logging
-
-from logging_config import setup_logging
 
-setup_logging()
-warning_logger = logging.getLogger('warning_logger')
-error_logger = logging.getLogger('error_logger')
+from src.utils.command_utils import get_commands
+from src.utils.gui_utils import flush_input
+from src.utils.logging_utils import warning_logger, error_logger
 
 
 class TexterUI:
@@ -199,6 +224,31 @@ class TexterUI:
     A class representing the Texter user interface.
     """
 
+    # Box-drawing lines framing each block in the commands box
+    _BOX_TOP = f"┌{'─' * 34}┐\n"
+    _BOX_MID = f"├{'─' * 34}┤\n"
+    _BOX_BOT = f"└{'─' * 34}┘\n"
+
+    # (app_state attribute, display label, app_state flag that must be set for the group to be shown)
+    _COMMAND_SPECS = (
+        ("info_commands", "info commands", None),
+        ("selection_commands", "selection commands", None),
+        ("git_commands", "git commands", None),
+        ("interactive_commands", "interactive commands", None),
+        ("browser_commands", "browser commands", None),
+        ("programming_commands", "programming commands", "programming"),
+        ("terminal_commands", "terminal commands", "terminal"),
+        ("spelling_commands", "spelling commands", None),
+        ("keyboard_commands", "keyboard commands", None),
+    )
+
+    # Window sizes with the commands section collapsed and expanded
+    _GEOM_COLLAPSED = "400x480"
+    _GEOM_EXPANDED = "400x705"
+
+    # Oldest input lines are dropped beyond this so long sessions keep the text box cheap to update
+    _MAX_INPUT_LINES = 5000
+
     def __init__(self, command_files_directory):
         """
         Initializes the TexterUI class with attributes for the user interface elements.
@@ -224,8 +274,6 @@ class TexterUI:
         self.status_height = 150
         self.commands_height = 300
 
-        self.collapsed_geometry = f"400x480"  # Adjusted collapsed geometry
-        self.expanded_geometry = f"400x705"  # Adjusted expanded geometry
         self.collapsed_commands_height = 0
 
         self.commands_label = None
@@ -235,15 +283,24 @@ class TexterUI:
         self.go_to_sleep_button = None
         self.terminate_button = None
         self.status_label = None
+        self._status_var = None
         self.status_text_box = None
         self.toggle_commands_button = None
         self.add_command_button = None
         self.commands = None
+        self._last_status = ""
+        self._pending_status = ""
+        self._status_scheduled = False
+        self._commands_cache_sig = None
+        self._rendered_commands = {}
+        self._input_line_count = 0
+        self._commands_expanded = True
+        self._commands_dirty = False
 
-        self.speech_thread: threading.Thread or None = None
+        self.speech_thread: threading.Thread | None = None
 
     def load_image(self, filename):
-        """Load and resize an image."""
+        """Load an image."""
         path = os.path.join(self.imgs_path, filename)
         return tk.PhotoImage(file=path)
 
@@ -303,8 +360,10 @@ class TexterUI:
 
     def configure_status_section(self):
         """Create the status section."""
-        self.status_label = tk.Label(self.root, text="Status", fg=self.font_color, bg=self.background_color,
-                                     font=("Arial", 12))
+        # Later label changes go through the variable, which Tk only repaints when the value differs
+        self._status_var = tk.StringVar(master=self.root, value="Status")
+        self.status_label = tk.Label(self.root, textvariable=self._status_var, fg=self.font_color,
+                                     bg=self.background_color, font=("Arial", 12))
         self.status_label.place(x=10, y=230, width=self.label_width, height=self.label_height)
 
         self.status_text_box = scrolledtext.ScrolledText(self.root, fg=self.font_color, bg="#383e4a",
@@ -328,46 +387,73 @@ class TexterUI:
                                                                  insertbackground=self.font_color,
                                                                  selectbackground="#515663",
                                                                  font=("Consolas", 10))
-        self.print_all_commands()
         self.commands_text_box.config(state=tk.DISABLED)
+        # Fill the box once the window has been drawn so start-up is not held up by the render
+        self.root.after_idle(self.print_all_commands)
         self.commands_text_box.place(x=0, y=440, width=self.window_width, height=self.commands_height)
 
     def reload_commands(self):
-        """Reload commands."""
-        self.commands_text_box.config(state=tk.NORMAL)
-        self.commands_text_box.delete(1.0, tk.END)
+        """Reload commands from the command files on a worker thread so the window stays responsive."""
+        threading.Thread(target=self._reload_commands_worker, daemon=True).start()
+
+    def _reload_commands_worker(self) -> None:
+        """Read the command files and hand the result back to the Tk thread."""
+        commands = get_commands(self.command_files_directory)
+        self.root.after(0, self._apply_reloaded_commands, commands)  # type: ignore
+
+    def _apply_reloaded_commands(self, commands: dict) -> None:
+        """Load reloaded commands into the app state and refresh the display if they changed."""
+        if not commands:
+            warning_logger.warning(f"No commands found in {self.command_files_directory}, keeping the current ones.")
+            return
+        if commands == self.app_state.commands:
+            return
+
+        self.commands = commands
+        self.app_state.load_commands(commands)
+        # Reloaded command files can change names without changing counts, so always redraw
+        self._commands_cache_sig = None
         self.print_all_commands()
-        self.commands_text_box.config(state=tk.DISABLED)
 
     def toggle_status_textbox(self):
         """Toggle commands section visibility."""
-        if self.commands_text_box.winfo_height() == self.commands_height:
+        self._commands_expanded = not self._commands_expanded
+        if not self._commands_expanded:
             self.commands_text_box.place(width=self.window_width, height=self.collapsed_commands_height)
             self.toggle_commands_button.config(text="▼")
-            self.root.geometry(self.collapsed_geometry)
+            self.root.geometry(self._GEOM_COLLAPSED)
         else:
             self.commands_text_box.place(width=self.window_width, height=self.commands_height)
             self.toggle_commands_button.config(text="▲")
-            self.root.geometry(self.expanded_geometry)
+            self.root.geometry(self._GEOM_EXPANDED)
+            if self._commands_dirty:
+                self._commands_dirty = False
+                self.print_all_commands()
 
     def on_terminate_button_click(self) -> None:
         """Terminate application."""
         self.app_state.terminate = True
-        if hasattr(self, "speech_thread") and self.speech_thread.is_alive():
-            self.speech_thread.join()
+        self._join_speech_thread()
+        # main() returns once the window is gone, which would take the daemon input thread with it
+        flush_input(raise_errors=False)
         self.root.destroy()
 
     def terminate_all_threads(self):
         """Terminate all threads safely."""
+        self.app_state.terminate = True
         try:
-            self.app_state.terminate = True
-            if hasattr(self, "speech_thread") and self.speech_thread.is_alive():
-                self.speech_thread.join()
-            sys.exit(0)
-        except AttributeError as e:
+            self._join_speech_thread()
+        except RuntimeError as e:
             error_logger.error(f"Error: {e}")
-        except Exception as e:
-            error_logger.error(f"Unexpected error: {e}")
+        # Let keystrokes that are still queued reach the target window before the process goes away
+        flush_input(raise_errors=False)
+        sys.exit(0)
+
+    def _join_speech_thread(self) -> None:
+        """Wait for the speech thread to finish, unless it is the thread asking."""
+        speech_thread = self.speech_thread
+        if speech_thread is not None and speech_thread is not threading.current_thread() and speech_thread.is_alive():
+            speech_thread.join()
 
     def on_wake_up_button_click(self) -> None:
         """Activate typing mode."""
@@ -380,85 +466,129 @@ class TexterUI:
         self.app_state.update_status()
 
     def get_active_commands(self):
-        """Get active commands."""
-        active_commands = {}
-
-        def process_commands(commands, type_name):
-            """
-            Processes a list of command objects, converts each to a dictionary,
-            serializes it to JSON, and stores the list of JSON strings under a
-            specified type name in the active_commands dictionary.
-
-            Args:
-                commands (list): A list of command objects, each expected to have
-                                 a commands_to_dict() method.
-                type_name (str): The key under which the processed commands will be
-                                 stored in the active_commands dictionary.
-            """
-            lst = []
-            for command in commands:
-                temp_dict = command.commands_to_dict()
-                temp_json = json.dumps(temp_dict)
-                lst.append(temp_json)
-            active_commands[type_name] = lst
-
-        process_commands(self.app_state.info_commands, "info commands")
-        process_commands(self.app_state.selection_commands, "selection commands")
-        process_commands(self.app_state.git_commands, "git commands")
-        process_commands(self.app_state.interactive_commands, "interactive commands")
-        process_commands(self.app_state.interactive_commands, "browser commands")
-
-        if self.app_state.programming:
-            process_commands(self.app_state.programming_commands, "programming commands")
-
-        if self.app_state.terminal:
-            process_commands(self.app_state.terminal_commands, "terminal commands")
-
-        process_commands(self.app_state.spelling_commands, "spelling commands")
-        process_commands(self.app_state.keyboard_commands, "keyboard commands")
-
-        return active_commands
-
-    @staticmethod
-    def format_command_block(command_type, commands):
+        """Get active command names grouped by display label."""
+        app_state = self.app_state
+        return {
+            label: [command.name for command in getattr(app_state, attribute)]
+            for attribute, label, gate in self._COMMAND_SPECS
+            if gate is None or getattr(app_state, gate)
+        }
+
+    @classmethod
+    def format_command_block(cls, command_type, commands):
         """Format commands for display."""
-        block = f"┌{'─' * 34}┐\n"
-        block += f"│ {command_type}:\n"
-        block += f"├{'─' * 34}┤\n"
-        for command in commands:
-            for key, val in json.loads(command).items():
-                if key == "name":
-                    block += f" {val}\n"
-        block += f"└{'─' * 34}┘\n"
+        block = f"{cls._BOX_TOP}│ {command_type}:\n{cls._BOX_MID}"
+        block += "".join(f" {command_name}\n" for command_name in commands)
+        block += cls._BOX_BOT
         return block
 
+    def get_commands_signature(self) -> tuple:
+        """Get a cheap signature that changes whenever the set of displayed commands does."""
+        app_state = self.app_state
+        return (app_state.programming, app_state.terminal,
+                *(len(getattr(app_state, attribute)) for attribute, _, _ in self._COMMAND_SPECS))
+
     def print_all_commands(self) -> None:
-        """Display active commands."""
+        """Display active commands, skipping the redraw when they have not changed or cannot be seen."""
+        if not self._commands_expanded:
+            # Rendered when the section is expanded again
+            self._commands_dirty = True
+            return
+
+        signature = self.get_commands_signature()
+        if signature == self._commands_cache_sig:
+            return
+        self._commands_cache_sig = signature
+
         commands = self.get_active_commands()
-        for command_type, command_list in commands.items():
-            self.commands_text_box.insert(tk.END, self.format_command_block(command_type, command_list))
+        self.commands_text_box.config(state=tk.NORMAL)
+        if list(commands) != list(self._rendered_commands):
+            self._render_all_command_blocks(commands)
+        else:
+            self._render_changed_command_blocks(commands)
+        self.commands_text_box.config(state=tk.DISABLED)
+        self._rendered_commands = commands
+
+    def _render_all_command_blocks(self, commands: dict) -> None:
+        """Redraw every command block and mark where each one starts."""
+        text_box = self.commands_text_box
+        blocks = [self.format_command_block(command_type, command_list)
+                  for command_type, command_list in commands.items()]
+        # One delete and one insert per redraw, so the widget is re-laid out once
+        text_box.delete(1.0, tk.END)
+        text_box.insert(tk.END, "".join(blocks))
+
+        mark_set = text_box.mark_set
+        mark_gravity = text_box.mark_gravity
+        left = tk.LEFT
+        offset = 0
+        for index, block in enumerate(blocks):
+            mark = f"commands_block_{index}"
+            mark_set(mark, f"1.0 + {offset} chars")
+            # Left gravity keeps the mark in front of text inserted at its position
+            mark_gravity(mark, left)
+            offset += len(block)
+
+    def _render_changed_command_blocks(self, commands: dict) -> None:
+        """Rewrite only the command blocks whose commands differ from the last render."""
+        text_box = self.commands_text_box
+        rendered_commands = self._rendered_commands
+        block_count = len(commands)
+        for index, (command_type, command_list) in enumerate(commands.items()):
+            if command_list == rendered_commands[command_type]:
+                continue
+
+            start = f"commands_block_{index}"
+            next_start = f"commands_block_{index + 1}" if index + 1 < block_count else None
+            block = self.format_command_block(command_type, command_list)
+            text_box.delete(start, next_start or "end-1c")
+            text_box.insert(start, block)
+            if next_start:
+                # The next block's mark sat at the deletion point, so it ended up in front of the new text
+                text_box.mark_set(next_start, f"{start} + {len(block)} chars")
 
     def print_status(self) -> None:
         """Update UI status."""
         self.app_state.update_status()
 
     def append_text(self, text: str) -> None:
-        """Append text to input box."""
+        """Append text to input box, discarding the oldest lines once the scrollback limit is reached."""
         self.input_text_box.config(state=tk.NORMAL)
         self.input_text_box.insert(tk.END, text + "\n")
+        self._input_line_count += text.count("\n") + 1
+        excess = self._input_line_count - self._MAX_INPUT_LINES
+        if excess > 0:
+            self.input_text_box.delete("1.0", f"{excess + 1}.0")
+            self._input_line_count = self._MAX_INPUT_LINES
         self.input_text_box.see(tk.END)
         self.input_text_box.config(state=tk.DISABLED)
 
     def update_status(self, status_message: str) -> None:
-        """Thread-safe status update."""
-        self.root.after(0, self._update_status_ui, status_message)
+        """Thread-safe status update. Bursts of updates are coalesced into a single redraw of the latest message."""
+        self._pending_status = status_message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after(16, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Render the most recent pending status message."""
+        # Clear the flag before reading so a concurrent update either lands in this flush or schedules another
+        self._status_scheduled = False
+        self._update_status_ui(self._pending_status)
 
     def _update_status_ui(self, status_message: str) -> None:
-        """Update status text box."""
+        """Update status text box, only touching the text that changed."""
+        if status_message == self._last_status:
+            return
+
         self.status_text_box.config(state=tk.NORMAL)
-        self.status_text_box.delete(1.0, tk.END)
-        self.status_text_box.insert(tk.END, status_message)
+        if self._last_status and status_message.startswith(self._last_status):
+            self.status_text_box.insert(tk.END, status_message[len(self._last_status):])
+        else:
+            self.status_text_box.delete(1.0, tk.END)
+            self.status_text_box.insert(tk.END, status_message)
         self.status_text_box.config(state=tk.DISABLED)
+        self._last_status = status_message
 
     def update_commands(self) -> None:
         """Thread-safe commands update."""
@@ -466,7 +596,4 @@ class TexterUI:
 
     def _update_commands_ui(self) -> None:
         """Update commands text box."""
-        self.commands_text_box.config(state=tk.NORMAL)
-        self.commands_text_box.delete(1.0, tk.END)
         self.print_all_commands()
-        self.commands_text_box.config(state=tk.DISABLED)
@@ -6,7 +6,7 @@ interpreting commands and writing output as needed.
 """
 from __future__ import annotations
 
-from src.commands.text_processor import TextProcessor
+from src.commands.text_processor import get_text_processor
 from src.utils.gui_utils import write
 from src.utils.string_utils import convert_to_spelling, string_to_camel_case, string_to_snake_case
 
@@ -40,7 +40,7 @@ def handle_dictation_mode(app_state, texter_ui, text: str) -> None:
     elif not app_state.handle_command(text):
         if app_state.typing_active:
             if app_state.punctuation:
-                text_processor = TextProcessor()
+                text_processor = get_text_processor()
                 text = text_processor.restore_punctuation(text)
                 if app_state.capitalize:
                     text = text_processor.capitalize_sentences(text)
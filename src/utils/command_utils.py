@@ -48,7 +48,7 @@ import os
 import subprocess
 
 from src.utils.logging_utils import warning_logger, error_logger
-from src.utils.gui_utils import write, press
+from src.utils.gui_utils import write, press, flush_input
 from src.utils.text_to_speech import text_to_speech
 
 
@@ -90,6 +90,8 @@ def focus_browser_window(browser="Chrome") -> None:
     Args:
         browser (str, optional): The name of the browser window to focus. Defaults to "Chrome".
     """
+    # Keystrokes still queued were meant for the window that has focus now
+    flush_input()
     try:
         # Search for the browser window
         result = subprocess.run(
@@ -148,4 +150,5 @@ def create_java_method(access_level: str) -> None:
     Args:
         access_level (str): The access level of the method (e.g., "public", "private").
     """
-    (write(access_level + " void () {}"), [press("left") for _ in range(0, 5)])
\ No newline at end of file
+    write(access_level + " void () {}")
+    press("left", count=5)
\ No newline at end of file
@@ -7,7 +7,7 @@ Functions:
 
 - `get_day_of_week`: Retrieves the day of the week for a given date.
     - Args:
-        - `date_str`: A string representing the date (e.g., '2024-12-16').
+        - `date`: A `datetime`, or a string representing the date (e.g., '2024-12-16').
         - `date_format`: The format of the input date string (default is "%Y-%m-%d").
     - Returns:
         - A string representing the day of the week (e.g., 'Monday').
@@ -27,8 +27,16 @@ Functions:
     - Returns:
         - A string representing the day number with its ordinal suffix (e.g., "1st", "2nd", "3rd").
 """
+from __future__ import annotations
+
 from datetime import datetime
 
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
+    "December"
+)
+_ORDINAL_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
+
 
 def get_current_time() -> str:
     """
@@ -40,19 +48,20 @@ def get_current_time() -> str:
     now = datetime.now()
     return now.strftime("%H:%M")
 
-def get_day_of_week(date_str: str, date_format:str="%Y-%m-%d") -> str:
+def get_day_of_week(date: datetime | str, date_format:str="%Y-%m-%d") -> str:
     """
     Get the day of the week for a given date.
 
     Args:
-        date_str (str): The date as a string (e.g., '2024-12-16').
+        date (datetime | str): The date, either as a datetime or as a string (e.g., '2024-12-16').
         date_format (str): The format of the input date string.
 
     Returns:
         str: The day of the week (e.g., 'Monday').
     """
-    date_obj = datetime.strptime(date_str, date_format)  # Convert string to datetime object
-    return date_obj.strftime("%A")
+    if isinstance(date, str):
+        date = datetime.strptime(date, date_format)  # Convert string to datetime object
+    return date.strftime("%A")
 
 def get_current_date() -> datetime:
     """
@@ -75,12 +84,8 @@ def month_number_to_name(month_number:int) -> str:
         str: The name of the month if the input is valid, or "Invalid month number" if the input is out of range.
 
     """
-    months = [
-        "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
-        "December"
-    ]
     if 1 <= month_number <= 12:
-        return months[month_number - 1]
+        return _MONTH_NAMES[month_number - 1]
     else:
         return "Invalid month number"
 
@@ -97,6 +102,6 @@ def day_number_to_name(day_number:int) -> str:
     if 10 <= day_number % 100 <= 20:
         suffix = "th"
     else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day_number % 10, "th")
+        suffix = _ORDINAL_SUFFIXES.get(day_number % 10, "th")
 
     return f"{day_number}{suffix}"
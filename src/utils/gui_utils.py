@@ -23,18 +23,173 @@ Functions:
   ```python
   write("Hello, world!")
   ```
+
+- `start_input_queue() -> InputQueue`:
+  Routes `press`, `write` and `scroll` through a background `InputQueue` so callers return immediately.
+
+- `flush_input(raise_errors: bool = True) -> None`:
+  Blocks until every queued input event has been sent, then re-raises the first send error, if any.
 """
+import queue
+import threading
+
 import pyautogui as gui
 
+from src.utils.logging_utils import error_logger
+
+
+class InputQueue:
+    """
+    Sends keyboard and mouse events from a single background thread, in the order they were queued.
+
+    Consecutive presses of the same single key are sent as one repeated press. The first error raised while
+    sending is kept and re-raised by the next `put` or `join`, so callers still learn that input was lost.
+    """
+
+    def __init__(self):
+        self._events = queue.Queue()
+        self._error = None
+        self._worker = threading.Thread(target=self._run, name="InputQueue", daemon=True)
+        self._worker.start()
+
+    def put(self, function, *args, **kwargs) -> None:
+        """
+        Queues a call to one of the input functions.
+
+        Args:
+            function (callable): The function that sends the input.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Raises:
+            Exception: The first error raised while sending earlier events, if it has not been reported yet.
+        """
+        self._raise_error()
+        self._events.put((function, args, kwargs))
+
+    def join(self, raise_errors: bool = True) -> None:
+        """
+        Blocks until every queued event has been sent.
+
+        Args:
+            raise_errors (bool): Whether to re-raise an unreported send error. It is cleared either way.
+
+        Raises:
+            Exception: The first error raised while sending, if it has not been reported yet.
+        """
+        self._events.join()
+        if raise_errors:
+            self._raise_error()
+        else:
+            self._error = None
+
+    def _raise_error(self) -> None:
+        """Re-raises and clears the stored send error, if there is one."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self) -> None:
+        pending = None
+        while True:
+            function, args, kwargs = pending or self._events.get()
+            pending = None
+            taken = 1
+            if function is _press and len(args) == 1:
+                count = kwargs.get("count", 1)
+                while True:
+                    try:
+                        event = self._events.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event[0] is not _press or event[1] != args:
+                        # Not part of the run; it is sent next and marked done then
+                        pending = event
+                        break
+                    count += event[2].get("count", 1)
+                    taken += 1
+                kwargs = {"count": count}
+            try:
+                function(*args, **kwargs)
+            except gui.FailSafeException as e:
+                # The user hit the fail-safe corner, so nothing else that was queued should be typed
+                if pending is not None:
+                    pending = None
+                    taken += 1
+                taken += self._discard_pending()
+                self._error = self._error or e
+                error_logger.error("pyautogui fail-safe triggered; discarded queued input")
+            except Exception as e:
+                self._error = self._error or e
+                error_logger.error(f"Failed to send input {getattr(function, '__name__', function)}{args}: {e}", exc_info=True)
+            finally:
+                for _ in range(taken):
+                    self._events.task_done()
+
+    def _discard_pending(self) -> int:
+        """
+        Drops every event still waiting in the queue.
+
+        Returns:
+            int: The number of events dropped.
+        """
+        discarded = 0
+        while True:
+            try:
+                self._events.get_nowait()
+            except queue.Empty:
+                return discarded
+            discarded += 1
+
+
+_input_queue = None
+
+def start_input_queue() -> InputQueue:
+    """
+    Starts sending input from a background thread. Safe to call more than once.
+
+    Returns:
+    - InputQueue: The queue that press, write and scroll now feed.
+    """
+    global _input_queue
+    if _input_queue is None:
+        _input_queue = InputQueue()
+    return _input_queue
+
+def flush_input(raise_errors: bool = True) -> None:
+    """
+    Blocks until all queued input has been sent. Does nothing if the input queue is not running.
+
+    Parameters:
+    - raise_errors (bool): Whether to re-raise the first error hit while sending. Exit paths pass False,
+      since the error has already been logged and there is nobody left to report it to.
+    """
+    if _input_queue is not None:
+        _input_queue.join(raise_errors)
+
+def _press(*keyboard_key: str, count: int=1) -> None:
+    """Sends a key press straight to pyautogui."""
+    if count == 1:
+        gui.hotkey(*keyboard_key)
+    elif len(keyboard_key) == 1:
+        # pyautogui repeats a single key itself without a pause between presses
+        gui.press(keyboard_key[0], presses=count, interval=0)
+    else:
+        for _ in range(count):
+            gui.hotkey(*keyboard_key)
+
 def press(*keyboard_key: str, count: int=1) -> None:
     """
     Simulates pressing a single keyboard key.
 
     Parameters:
     - keyboard_key (str): The key to press.
+    - count (int): How many times to press it.
     """
-    for _ in range(0, count):
-        gui.hotkey(*keyboard_key)
+    if _input_queue is None:
+        _press(*keyboard_key, count=count)
+    else:
+        _input_queue.put(_press, *keyboard_key, count=count)
 
 def write(text: str) -> None:
     """
@@ -43,7 +198,10 @@ def write(text: str) -> None:
     Parameters:
     - text (str): The text to type.
     """
-    gui.write(text)
+    if _input_queue is None:
+        gui.write(text)
+    else:
+        _input_queue.put(gui.write, text)
 
 def scroll(pixels: int) -> None:
     """
@@ -52,4 +210,7 @@ def scroll(pixels: int) -> None:
     Parameters:
     - pixels (int): The number of pixels to scroll. Positive values scroll up, and negative values scroll down.
     """
-    gui.scroll(pixels)
+    if _input_queue is None:
+        gui.scroll(pixels)
+    else:
+        _input_queue.put(gui.scroll, pixels)
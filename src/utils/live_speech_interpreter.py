@@ -30,19 +30,20 @@ def run_live_speech_interpreter(app_state: AppState, app_ui: TexterUI) -> None:
     """
     while not app_state.terminate:
         try:
-            live_speech_interpreter(app_state, app_ui)
+            live_speech_interpreter(app_state, app_ui, recognizer)
         except Exception as e:
             info_logger.error(f"Error in live speech interpreter: {e}", exc_info=True)
             time.sleep(1)  # Prevent tight error loop
 
 
-def live_speech_interpreter(app_state: AppState, texter_ui: TexterUI):
+def live_speech_interpreter(app_state: AppState, texter_ui: TexterUI, recognizer: sr.Recognizer) -> None:
     """
     Continuously listens for and interprets speech commands, executing corresponding actions.
 
     Args:
-        texter_ui(TexterUI): frontend
         app_state (AppState): The current application state, including typing status and loaded commands.
+        texter_ui(TexterUI): frontend
+        recognizer (sr.Recognizer): The speech recognition object used to capture and transcribe audio.
     
     This function will loop until app_state.terminate is set to True.
     """
@@ -1,7 +1,9 @@
-from logging_config import setup_logging
+"""
+Shared application loggers. Handlers are attached by `logging_config.setup_logging()`, which the entry point
+calls once at start-up, so importing this module has no side effects.
+"""
 import logging
 
-setup_logging()
 info_logger = logging.getLogger('general_logger')
 error_logger = logging.getLogger('error_logger')
 warning_logger = logging.getLogger('warning_logger')
\ No newline at end of file
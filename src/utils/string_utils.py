@@ -34,8 +34,9 @@ Functions:
     - Returns:
         - `int`: The extracted numeric value, or 1 if extraction fails.
 """
+import functools
+
 from word2number import w2n
-import speech_recognition as sr
 
 def numeric_str_to_int(numeric_str:str) -> int:
     """
@@ -66,6 +67,7 @@ def convert_to_spelling(text: str, spelling_commands: list) -> str:
     word_to_key = {command.name: command.action for command in spelling_commands}
     return "".join(word_to_key.get(word, "") for word in text.split())
 
+@functools.lru_cache(maxsize=256)
 def string_to_camel_case(input_str: str, lower: bool = False) -> str:
     """Capitalizes the first letter of each word in a string.
 
@@ -112,5 +114,5 @@ def extract_number_from_string(text: str) -> int:
             return int(text)
         else:
             return numeric_str_to_int(text)
-    except (ValueError, sr.UnknownValueError):
+    except ValueError:
         return 1
\ No newline at end of file
@@ -87,6 +87,23 @@ class TestAppState(unittest.TestCase):
         self.assertTrue(handled)
         mock_write.assert_called_with("a")
 
+    @patch.object(CommandManager, "execute", autospec=True)
+    def test_handle_command_first_match(self, mock_execute):
+        """Test that handle_command runs the first matching command and sees replaced command groups."""
+        go = CommandManager("go", CommandType.SWITCH, action="pass")
+        go_back = CommandManager("go back", CommandType.KEYBOARD, action="pass")
+        self.app_state.switch_commands = [go]
+        self.app_state.keyboard_commands = [go_back]
+
+        self.assertTrue(self.app_state.handle_command("go back"))
+        mock_execute.assert_called_once_with(go, self.app_state)
+        self.assertFalse(self.app_state.handle_command("stop"))
+
+        stop = CommandManager("stop", CommandType.KEYBOARD, action="pass")
+        self.app_state.keyboard_commands = [stop]
+        self.assertTrue(self.app_state.handle_command("stop"))
+        mock_execute.assert_called_with(stop, self.app_state)
+
     def test_switch_mode(self):
         """Test switching between dictation and spelling modes."""
         self.assertEqual(self.app_state.mode, "dictation")
@@ -95,6 +112,22 @@ class TestAppState(unittest.TestCase):
         self.app_state.switch_mode()
         self.assertEqual(self.app_state.mode, "dictation")
 
+    def test_switch_capitalization(self):
+        """Test that caps can be toggled off while punctuation stays on."""
+        self.app_state.switch_capitalization()
+        self.assertTrue(self.app_state.capitalize)
+        self.assertTrue(self.app_state.punctuation)
+        self.app_state.switch_capitalization()
+        self.assertFalse(self.app_state.capitalize)
+        self.assertTrue(self.app_state.punctuation)
+
+    def test_switch_punctuation(self):
+        """Test that turning punctuation off also turns caps off."""
+        self.app_state.switch_capitalization()
+        self.app_state.switch_punctuation()
+        self.assertFalse(self.app_state.punctuation)
+        self.assertFalse(self.app_state.capitalize)
+
     @patch("builtins.print")
     def test_print_status(self, mock_print):
         """Test that print_status outputs correct application status."""
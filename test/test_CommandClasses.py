@@ -1,8 +1,10 @@
 import unittest
 from unittest.mock import patch, Mock, call
 
+from src.commands import command_executors
+from src.commands.command_executors import ActionExecutor, _build_action_thunk
 from src.commands.command_manager import CommandManager
-from src.constants.command_constants import CommandType
+from src.constants.command_constants import CommandType, ProgrammingLanguage
 
 
 class TestCommandClasses(unittest.TestCase):
@@ -66,5 +68,65 @@ class TestCommandClasses(unittest.TestCase):
         self.assertEqual(self.command._extract_number_from_string("invalid"), 1)
 
 
+
+class TestActionExecutor(unittest.TestCase):
+    def run_action(self, action, use_thunk):
+        """Runs an action through the prebuilt thunk or the exec fallback and returns the calls it made."""
+        recorder = Mock()
+        app_state = recorder.app_state
+        patches = [
+            patch.object(command_executors, name, getattr(recorder, name)) for name in ("press", "write", "scroll")
+        ]
+        if not use_thunk:
+            patches.append(patch.object(command_executors, "_build_action_thunk", return_value=None))
+        for patcher in patches:
+            patcher.start()
+        try:
+            ActionExecutor.execute(action, app_state)
+        finally:
+            for patcher in patches:
+                patcher.stop()
+        return recorder.mock_calls, app_state
+
+    def assert_thunk_matches_exec(self, action):
+        self.assertIsNotNone(_build_action_thunk(action))
+        thunk_calls, thunk_state = self.run_action(action, use_thunk=True)
+        exec_calls, exec_state = self.run_action(action, use_thunk=False)
+        self.assertEqual(thunk_calls, exec_calls)
+        return thunk_calls, thunk_state, exec_state
+
+    def test_press_with_count(self):
+        calls, _, _ = self.assert_thunk_matches_exec('press("left", count=5)')
+        self.assertIn(call.press("left", count=5), calls)
+
+    def test_write_with_newline_and_tab(self):
+        calls, _, _ = self.assert_thunk_matches_exec('write("class :\\n\\tdef __init__(self):")')
+        self.assertIn(call.write("class :\n\tdef __init__(self):"), calls)
+
+    def test_setattr_on_app_state(self):
+        _, thunk_state, exec_state = self.assert_thunk_matches_exec('setattr(app_state, "typing_active", False)')
+        self.assertIs(thunk_state.typing_active, False)
+        self.assertIs(exec_state.typing_active, False)
+
+    def test_programming_language_argument(self):
+        calls, _, _ = self.assert_thunk_matches_exec(
+            "(app_state.set_programming_language(ProgrammingLanguage.JAVA), app_state.load_programming_commands())"
+        )
+        self.assertEqual(calls[:2], [
+            call.app_state.set_programming_language(ProgrammingLanguage.JAVA),
+            call.app_state.load_programming_commands(),
+        ])
+
+    def test_tuple_of_calls(self):
+        calls, _, _ = self.assert_thunk_matches_exec('(write("ls"), press("enter"), scroll(-3))')
+        self.assertEqual(calls[:3], [call.write("ls"), call.press("enter"), call.scroll(-3)])
+
+    def test_free_name_falls_back_to_exec(self):
+        action = "scroll(-window_height_in_pixels)"
+        self.assertIsNone(_build_action_thunk(action))
+        with self.assertRaises(NameError):
+            self.run_action(action, use_thunk=True)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch, call
+
+from src.utils import gui_utils
+from src.utils.gui_utils import InputQueue, flush_input, press, write
+
+
+class FakeFailSafeException(Exception):
+    pass
+
+
+class TestInputQueue(unittest.TestCase):
+    def setUp(self):
+        self.gui = Mock()
+        self.gui.FailSafeException = FakeFailSafeException
+        gui_patcher = patch.object(gui_utils, "gui", self.gui)
+        gui_patcher.start()
+        self.addCleanup(gui_patcher.stop)
+
+        self.input_queue = InputQueue()
+        queue_patcher = patch.object(gui_utils, "_input_queue", self.input_queue)
+        queue_patcher.start()
+        self.addCleanup(queue_patcher.stop)
+
+        # Hold the worker until every event of a test is queued, so coalescing does not depend on timing
+        self.release = threading.Event()
+        self.input_queue.put(self.release.wait)
+
+    def send_queued(self, raise_errors=True):
+        self.release.set()
+        flush_input(raise_errors)
+
+    def test_consecutive_presses_of_one_key_are_coalesced(self):
+        for _ in range(5):
+            press("left")
+        press("left", count=2)
+        write("abc")
+        press("left")
+        self.send_queued()
+
+        self.assertEqual(self.gui.mock_calls, [
+            call.press("left", presses=7, interval=0),
+            call.write("abc"),
+            call.hotkey("left"),
+        ])
+
+    def test_hotkeys_are_not_coalesced(self):
+        press("ctrl", "c")
+        press("ctrl", "c")
+        self.send_queued()
+
+        self.assertEqual(self.gui.hotkey.call_args_list, [call("ctrl", "c"), call("ctrl", "c")])
+        self.gui.press.assert_not_called()
+
+    def test_flush_input_waits_for_queued_input(self):
+        write("hello")
+        press("enter")
+        self.gui.write.assert_not_called()
+
+        self.send_queued()
+
+        self.gui.write.assert_called_once_with("hello")
+        self.gui.hotkey.assert_called_once_with("enter")
+
+    def test_fail_safe_discards_queued_input_and_is_reported(self):
+        self.gui.write.side_effect = [FakeFailSafeException(), None]
+        write("first")
+        press("enter")
+        write("second")
+
+        with self.assertRaises(FakeFailSafeException):
+            self.send_queued()
+
+        self.gui.hotkey.assert_not_called()
+        self.assertEqual(self.gui.write.call_args_list, [call("first")])
+
+        # The error is reported once; input sent afterwards goes through again
+        write("after")
+        flush_input()
+        self.assertEqual(self.gui.write.call_args_list, [call("first"), call("after")])
+
+    def test_send_error_is_reported_by_next_put(self):
+        self.gui.write.side_effect = RuntimeError("display gone")
+        write("lost")
+        self.release.set()
+        self.input_queue._events.join()
+
+        with self.assertRaises(RuntimeError):
+            press("enter")
+
+    def test_flush_input_can_ignore_send_errors(self):
+        self.gui.write.side_effect = [RuntimeError("display gone"), None]
+        write("lost")
+        self.send_queued(raise_errors=False)
+
+        write("sent")
+        flush_input()
+        self.assertEqual(self.gui.write.call_args_list, [call("lost"), call("sent")])
+
+
+if __name__ == "__main__":
+    unittest.main()
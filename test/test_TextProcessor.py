@@ -88,5 +88,78 @@ class TestTextProcessor(unittest.TestCase):
         self.assertEqual(result, expected_output)
 
 
+
+def fake_token(word, start, end, entity, score=0.99):
+    return {"word": word, "start": start, "end": end, "entity": entity, "score": score}
+
+
+class TestTextProcessorAlignment(unittest.TestCase):
+    @patch.object(TextProcessor, "_initialize_pipeline")
+    def make_processor(self, pipe, mock_initialize_pipeline, chunk_size=230, overlap=5):
+        text_processor = TextProcessor(chunk_size=chunk_size, overlap=overlap, quantize=False)
+        text_processor.pipe = pipe
+        return text_processor
+
+    def test_align_predictions_multi_subtoken_word(self):
+        # "wonderful" is split into three subtokens; only the last one carries its label
+        words = ["Hello", "wonderful", "world", "again"]
+        results = [
+            fake_token("▁Hello", 0, 5, "0"),
+            fake_token("▁won", 6, 9, "0"),
+            fake_token("der", 9, 12, "0"),
+            fake_token("ful", 12, 15, ","),
+            fake_token("▁world", 16, 21, "."),
+            fake_token("▁again", 22, 27, "0"),
+        ]
+        aligned = TextProcessor._align_predictions(words, results)
+        self.assertEqual([(word, label) for word, label, _ in aligned],
+                         [("Hello", "0"), ("wonderful", ","), ("world", "."), ("again", "0")])
+
+    def test_align_predictions_low_confidence_and_missing_tokens(self):
+        words = ["one", "two", "three"]
+        results = [
+            fake_token("▁one", 0, 3, ".", score=0.5),
+            fake_token("▁t", 4, 5, "0"),
+            fake_token("wo", 5, 7, "?"),
+        ]
+        aligned = TextProcessor._align_predictions(words, results)
+        self.assertEqual(aligned, [("one", "0", 0.0), ("two", "?", 0.99), ("three", "0", 0.0)])
+
+    def test_predict_labels_each_word_once_across_chunks(self):
+        pipe_texts = []
+
+        def fake_pipe(texts, batch_size):
+            # Label every word with itself so the merged output shows exactly which chunk copy was kept
+            for text in texts:
+                pipe_texts.append(text)
+                tokens, start = [], 0
+                for word in text.split(" "):
+                    tokens.append(fake_token("▁" + word, start, start + len(word), word))
+                    start += len(word) + 1
+                yield tokens
+
+        words = [f"w{i}" for i in range(11)]
+        for chunk_size, overlap in ((4, 2), (5, 3)):
+            with self.subTest(chunk_size=chunk_size, overlap=overlap):
+                pipe_texts.clear()
+                text_processor = self.make_processor(fake_pipe, chunk_size=chunk_size, overlap=overlap)
+                predictions = text_processor._predict(words)
+
+                self.assertGreaterEqual(len(pipe_texts), 3)
+                self.assertEqual([word for word, _, _ in predictions], words)
+                self.assertEqual([label for _, label, _ in predictions], words)
+
+
+
+class TestCpuThreads(unittest.TestCase):
+    @patch("src.commands.text_processor.os.cpu_count", return_value=8)
+    @patch("src.commands.text_processor.torch")
+    def test_thread_override(self, mock_torch, mock_cpu_count):
+        for value, expected in (("3", 3), ("", 8), ("many", 8), ("0", 8), ("-2", 8)):
+            with self.subTest(value=value), patch.dict(os.environ, {"TEXTER_NUM_THREADS": value}):
+                TextProcessor._configure_cpu_threads()
+                mock_torch.set_num_threads.assert_called_with(expected)
+
+
 if __name__ == "__main__":
     unittest.main()